@@ -5,13 +5,19 @@ Copy this entire file as app.py and run with: streamlit run app.py
 
 import streamlit as st
 import streamlit.components.v1 as components
-import requests
+import requests_cache
+import asyncio
+import aiohttp
+import orjson
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
 import time
+import threading
+from functools import lru_cache
+from typing import Final, NamedTuple
 import os
+import hashlib
 
 # Page configuration
 st.set_page_config(
@@ -20,189 +26,365 @@ st.set_page_config(
     layout="wide"
 )
 
+# Static page content, defined once at import time
+_CSS: Final[str] = """
+.main-header {
+    font-size: 3rem;
+    color: #2E7D32;
+    text-align: center;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+.sub-header {
+    font-size: 1.3rem;
+    color: #558B2F;
+    text-align: center;
+    margin-bottom: 30px;
+}
+.metric-card {
+    background: linear-gradient(135deg, #E8F5E9 0%, #C8E6C9 100%);
+    padding: 20px;
+    border-radius: 10px;
+    border-left: 5px solid #4CAF50;
+    margin: 10px 0;
+}
+.stat-big {
+    font-size: 2.5rem;
+    font-weight: bold;
+    color: #2E7D32;
+}
+.recommendation {
+    background: #FFF3E0;
+    padding: 15px;
+    border-radius: 8px;
+    border-left: 4px solid #FF9800;
+    margin: 10px 0;
+}
+.success-box {
+    background: #E8F5E9;
+    padding: 20px;
+    border-radius: 10px;
+    border: 2px solid #4CAF50;
+}
+.warning-box {
+    background: #FFF3E0;
+    padding: 20px;
+    border-radius: 10px;
+    border: 2px solid #FF9800;
+}
+"""
+
+_MISSION_HTML: Final[str] = """
+<div class="success-box">
+<h3 style="color: green;">🎯 Your Mission</h3>
+<p style="color: green;">You're a farm manager using NASA satellite data to optimize your harvest. 
+Make smart decisions about irrigation and fertilization based on real climate data!</p>
+<p style="color: green;"><strong>Goal:</strong> Maximize yield while conserving resources.</p>
+</div>
+"""
+
+_LEARNED_HTML: Final[str] = """
+<div class="success-box">
+<p style="color: blue;"><strong>NASA satellite data helps farmers:</strong></p>
+<ul>
+    <li style="color: blue;">✅ Monitor soil moisture for optimal irrigation</li>
+    <li style="color: blue;">✅ Track temperature and rainfall patterns</li>
+    <li style="color: blue;">✅ Make data-driven conservation decisions</li>
+    <li style="color: blue;">✅ Improve yields sustainably (15-25% increase possible!)</li>
+    <li style="color: blue;">✅ Save water (20-30% reduction with precision agriculture)</li>
+</ul>
+</div>
+"""
+
 # Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 3rem;
-        color: #2E7D32;
-        text-align: center;
-        font-weight: bold;
-        margin-bottom: 10px;
-    }
-    .sub-header {
-        font-size: 1.3rem;
-        color: #558B2F;
-        text-align: center;
-        margin-bottom: 30px;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #E8F5E9 0%, #C8E6C9 100%);
-        padding: 20px;
-        border-radius: 10px;
-        border-left: 5px solid #4CAF50;
-        margin: 10px 0;
-    }
-    .stat-big {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #2E7D32;
-    }
-    .recommendation {
-        background: #FFF3E0;
-        padding: 15px;
-        border-radius: 8px;
-        border-left: 4px solid #FF9800;
-        margin: 10px 0;
-    }
-    .success-box {
-        background: #E8F5E9;
-        padding: 20px;
-        border-radius: 10px;
-        border: 2px solid #4CAF50;
-    }
-    .warning-box {
-        background: #FFF3E0;
-        padding: 20px;
-        border-radius: 10px;
-        border: 2px solid #FF9800;
+st.markdown(f"<style>{_CSS}</style>", unsafe_allow_html=True)
+
+# Charting libraries are imported on first use so the welcome page loads faster
+@lru_cache(maxsize=1)
+def _get_plt():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+@lru_cache(maxsize=1)
+def _get_plotly():
+    import plotly.express as px
+    import plotly.io as pio
+    return px, pio
+
+# Shared NASA POWER request cache
+NASA_POWER_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
+
+def _power_params(lat, lon, start, end):
+    return {
+        'parameters': 'T2M,PRECTOTCORR,GWETROOT,ALLSKY_SFC_SW_DWN',
+        'community': 'AG',
+        'longitude': round(lon, 2),
+        'latitude': round(lat, 2),
+        'start': start,
+        'end': end,
+        'format': 'JSON'
     }
-    </style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_http_session():
+    """HTTP session backed by an on-disk SQLite cache with a 24-hour expiry."""
+    return requests_cache.CachedSession('nasa_cache', backend='sqlite', expire_after=86400)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def fetch_nasa_climate(lat: float, lon: float, start: str, end: str) -> dict:
+    """Fetch NASA POWER data, shared across sessions and persisted to disk.
+
+    The date window is part of the cache key, so entries roll over daily.
+    Failed requests raise and are therefore never cached.
+    """
+    params = _power_params(lat, lon, start, end)
+    response = get_http_session().get(NASA_POWER_URL, params=params, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+async def _fetch_one(session, lat, lon, start, end):
+    params = _power_params(lat, lon, start, end)
+    async with session.get(NASA_POWER_URL, params=params) as response:
+        response.raise_for_status()
+        return orjson.loads(await response.read())
+
+async def _prefetch_all(locations, start, end):
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            *[_fetch_one(session, lat, lon, start, end) for lat, lon in locations],
+            return_exceptions=True
+        )
+
+def _prefetch_into(results, days):
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    keys = list(SCENARIOS.keys())
+    locations = [(round(SCENARIOS[k].lat, 2), round(SCENARIOS[k].lon, 2)) for k in keys]
+    
+    try:
+        fetched = asyncio.run(_prefetch_all(
+            locations, start_date.strftime('%Y%m%d'), end_date.strftime('%Y%m%d')
+        ))
+    except Exception:
+        return
+    
+    results.update((k, data) for k, data in zip(keys, fetched) if not isinstance(data, BaseException))
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def prefetch_scenarios(days=30):
+    """Fetch every scenario concurrently, once per server rather than per user.
+
+    The fetch runs on a background thread so it never holds up a page
+    render. Returns a dict of scenario key -> NASA data that fills in when
+    the fetch completes; scenarios that are missing (still in flight or
+    failed) fall back to the regular fetcher.
+    """
+    results = {}
+    threading.Thread(target=_prefetch_into, args=(results, days), daemon=True).start()
+    return results
 
 # NASA Data Fetcher Class
 class NASADataFetcher:
-    BASE_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
-    
-    def __init__(self):
-        self.cache = {}
+    BASE_URL = NASA_POWER_URL
     
     def get_climate_data(self, lat, lon, days=30):
+        # Quantize so nearly identical coordinates share a cache entry
+        lat, lon = round(lat, 2), round(lon, 2)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        params = {
-            'parameters': 'T2M,PRECTOTCORR,GWETROOT,ALLSKY_SFC_SW_DWN',
-            'community': 'AG',
-            'longitude': lon,
-            'latitude': lat,
-            'start': start_date.strftime('%Y%m%d'),
-            'end': end_date.strftime('%Y%m%d'),
-            'format': 'JSON'
-        }
-        
-        cache_key = f"{lat}_{lon}_{days}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            self.cache[cache_key] = data
-            return data
+            return fetch_nasa_climate(
+                lat,
+                lon,
+                start_date.strftime('%Y%m%d'),
+                end_date.strftime('%Y%m%d')
+            )
         except:
             return self._get_sample_data(days)
     
     def _get_sample_data(self, days=30):
-        dates = pd.date_range(end=datetime.now(), periods=days)
+        dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=days)
+        keys = dates.strftime('%Y%m%d').tolist()
+        rng = np.random.default_rng()
+        idx = np.arange(days)
+        
+        t2m = 20 + idx % 10 + rng.random(days, dtype=np.float32) * 3
+        precip = 2.5 + idx % 5 + rng.random(days, dtype=np.float32)
+        soil = 0.3 + (idx % 3) * 0.1 + rng.random(days, dtype=np.float32) * 0.1
+        solar = 5.5 + rng.random(days, dtype=np.float32)
+        
         return {
             'properties': {
                 'parameter': {
-                    'T2M': {date.strftime('%Y%m%d'): 20 + i % 10 + np.random.random() * 3 
-                            for i, date in enumerate(dates)},
-                    'PRECTOTCORR': {date.strftime('%Y%m%d'): 2.5 + (i % 5) + np.random.random() 
-                                    for i, date in enumerate(dates)},
-                    'GWETROOT': {date.strftime('%Y%m%d'): 0.3 + (i % 3) * 0.1 + np.random.random() * 0.1 
-                                 for i, date in enumerate(dates)},
-                    'ALLSKY_SFC_SW_DWN': {date.strftime('%Y%m%d'): 5.5 + np.random.random() 
-                                          for i, date in enumerate(dates)}
+                    'T2M': dict(zip(keys, t2m.tolist())),
+                    'PRECTOTCORR': dict(zip(keys, precip.tolist())),
+                    'GWETROOT': dict(zip(keys, soil.tolist())),
+                    'ALLSKY_SFC_SW_DWN': dict(zip(keys, solar.tolist()))
                 }
             }
         }
 
+# HTML dashboard
+_DASH_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Harvest Horizon – {scenario_name}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; background: #f0f8f0; padding: 20px; }}
+        h1 {{ color: #2e7d32; }}
+        .container {{ max-width: 1200px; margin: auto; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🛰️ NASA Dashboard: {scenario_name}</h1>
+        <p>Real satellite data driving your farming decisions.</p>
+        {chart}
+        
+        <h2>🌱 Scenario Info</h2>
+        <p><strong>Crop:</strong> {crop}</p>
+        <p><strong>Difficulty:</strong> {difficulty}</p>
+    </div>
+</body>
+</html>
+"""
+
+@st.cache_data(persist="disk", show_spinner=False)
+def render_dashboard_html(scenario_name: str, crop: str, difficulty: str, moisture: tuple) -> str:
+    """Build the dashboard HTML; cached on its inputs so the chart is built once."""
+    px, pio = _get_plotly()
+    
+    df = pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=len(moisture)),
+        'moisture': moisture
+    })
+    
+    fig = px.line(df, x='date', y='moisture', 
+                title=f"SMAP Soil Moisture – {scenario_name}",
+                labels={'moisture': 'Moisture (%)'})
+    
+    return _DASH_TEMPLATE.format(
+        scenario_name=scenario_name,
+        chart=pio.to_html(fig, include_plotlyjs='cdn', full_html=False),
+        crop=crop,
+        difficulty=difficulty
+    )
+
+@st.cache_resource
+def get_nasa_fetcher():
+    """One fetcher per server process, shared by every session."""
+    return NASADataFetcher()
+
+# Yield scoring tables
+@lru_cache(maxsize=None)
+def _yield_tables(opt_irr, opt_fert):
+    """Precompute yield adjustments for every 0-100 slider level.
+
+    Returns (irrigation, fertilizer) score arrays: irrigation is indexed by
+    [soil regime (dry, normal, wet), level], fertilizer by level.
+    """
+    levels = np.arange(101)
+    
+    irrigation = np.stack([
+        np.where(levels >= 50, 15, -30),
+        np.maximum(0, 20 - np.abs(levels - opt_irr) / 2),
+        np.where(levels <= 30, 20, -25)
+    ]).astype(np.float64)
+    
+    fert_diff = np.abs(levels - opt_fert)
+    fertilizer = np.select(
+        [fert_diff <= 10, fert_diff <= 20, levels > 80, levels < 20],
+        [25, 10, -15, -20],
+        default=0
+    )
+    
+    return irrigation, fertilizer
+
+# Recommendations - a pure function of the rounded averages, so memoize it
+@lru_cache(maxsize=256)
+def _recommendations(soil, precip, temp):
+    recs = []
+    
+    if soil < 0.3:
+        recs.append("⚠️ Low soil moisture detected - consider increasing irrigation")
+    if precip < 2.0:
+        recs.append("☀️ Low rainfall period - crops may need supplemental water")
+    if temp > 30:
+        recs.append("🌡️ High temperatures - increase irrigation to compensate")
+    if soil > 0.5 and precip > 5:
+        recs.append("💧 High moisture levels - reduce irrigation to prevent overwatering")
+    if not recs:
+        recs.append("✅ Conditions are optimal for current crop")
+    
+    return tuple(recs)
+
 # Game Logic Class
 class FarmingSimulator:
     def __init__(self, scenario_data):
         self.scenario = scenario_data
         self.nasa_data = None
+        self._analysis = None
         self.decisions = {'irrigation': 50, 'fertilizer': 50}
         
-    def load_nasa_data(self, fetcher):
-        loc = self.scenario['location']
-        self.nasa_data = fetcher.get_climate_data(loc['lat'], loc['lon'])
+    def load_nasa_data(self, fetcher, prefetched=None):
+        if prefetched:
+            self.nasa_data = prefetched
+        else:
+            self.nasa_data = fetcher.get_climate_data(self.scenario.lat, self.scenario.lon)
+        self._analysis = None
     
     def analyze_conditions(self):
         if not self.nasa_data:
             return {}
         
-        params = self.nasa_data['properties']['parameter']
-        temps = list(params['T2M'].values())
-        precip = list(params['PRECTOTCORR'].values())
-        soil = list(params['GWETROOT'].values())
+        # The data only changes in load_nasa_data, so every rerun reuses this
+        if self._analysis is not None:
+            return self._analysis
         
-        return {
-            'avg_temperature': round(sum(temps) / len(temps), 1),
-            'avg_precipitation': round(sum(precip) / len(precip), 2),
-            'avg_soil_moisture': round(sum(soil) / len(soil), 2),
-            'temp_data': temps[:10],
-            'precip_data': precip[:10],
-            'soil_data': soil[:10]
+        params = self.nasa_data['properties']['parameter']
+        # One float32 frame (dates x parameters) serves every mean and chart slice
+        df = pd.DataFrame({k: pd.Series(v, dtype='float32') for k, v in params.items()})
+        means = df.mean()
+        head = df.head(10)
+        
+        # Round after converting to float so the metrics display cleanly
+        self._analysis = {
+            'avg_temperature': round(float(means['T2M']), 1),
+            'avg_precipitation': round(float(means['PRECTOTCORR']), 2),
+            'avg_soil_moisture': round(float(means['GWETROOT']), 2),
+            'temp_data': head['T2M'].tolist(),
+            'precip_data': head['PRECTOTCORR'].tolist(),
+            'soil_data': head['GWETROOT'].tolist()
         }
+        return self._analysis
     
     def generate_recommendations(self, analysis):
-        recs = []
-        soil = analysis['avg_soil_moisture']
-        precip = analysis['avg_precipitation']
-        temp = analysis['avg_temperature']
-        
-        if soil < 0.3:
-            recs.append("⚠️ Low soil moisture detected - consider increasing irrigation")
-        if precip < 2.0:
-            recs.append("☀️ Low rainfall period - crops may need supplemental water")
-        if temp > 30:
-            recs.append("🌡️ High temperatures - increase irrigation to compensate")
-        if soil > 0.5 and precip > 5:
-            recs.append("💧 High moisture levels - reduce irrigation to prevent overwatering")
-        if not recs:
-            recs.append("✅ Conditions are optimal for current crop")
-        
-        return recs
-    
-    def calculate_yield(self, irrigation, fertilizer):
-        analysis = self.analyze_conditions()
-        base_yield = 100
+        return list(_recommendations(
+            round(analysis['avg_soil_moisture'], 2),
+            round(analysis['avg_precipitation'], 2),
+            round(analysis['avg_temperature'], 1)
+        ))
+    
+    def calculate_yield(self, irrigation, fertilizer, analysis=None):
+        if analysis is None:
+            analysis = self.analyze_conditions()
         
         soil = analysis['avg_soil_moisture']
-        optimal = self.scenario['optimal']
-        
-        # Irrigation scoring
-        if soil < 0.3:
-            if irrigation >= 50:
-                base_yield += 15
-            else:
-                base_yield -= 30
-        elif soil > 0.5:
-            if irrigation <= 30:
-                base_yield += 20
-            else:
-                base_yield -= 25
-        else:
-            irr_diff = abs(irrigation - optimal['irrigation'])
-            base_yield += max(0, 20 - irr_diff / 2)
-        
-        # Fertilizer scoring
-        fert_diff = abs(fertilizer - optimal['fertilizer'])
-        if fert_diff <= 10:
-            base_yield += 25
-        elif fert_diff <= 20:
-            base_yield += 10
-        elif fertilizer > 80:
-            base_yield -= 15
-        elif fertilizer < 20:
-            base_yield -= 20
-        
-        yield_pct = max(0, min(150, base_yield))
+        # Soil regime picks the irrigation row: dry, normal, wet
+        regime = 0 if soil < 0.3 else 2 if soil > 0.5 else 1
+        
+        irr_scores, fert_scores = _yield_tables(self.scenario.opt_irr, self.scenario.opt_fert)
+        base_yield = 100 + irr_scores[regime, int(irrigation)] + fert_scores[int(fertilizer)]
+        
+        yield_pct = float(np.clip(base_yield, 0, 150))
+        if yield_pct.is_integer():
+            yield_pct = int(yield_pct)
+        
         water_usage = irrigation * 10
         fert_cost = fertilizer * 5
         
@@ -239,82 +421,128 @@ class FarmingSimulator:
         return "\n".join(feedback)
 
     # In your FarmingSimulator class (or as a helper function)
-    def generate_html_dashboard(self, nasa_data, scenario_name):
-        """Generate a local HTML file with NASA visualizations"""
-        import plotly.express as px
-        import plotly.io as pio
-
-        # Example: Create a soil moisture chart
-        df = pd.DataFrame({
-            'date': pd.date_range('2024-01-01', periods=30),
-            'moisture': nasa_data.get('moisture_series', [30]*30)
-        })
-        
-        fig = px.line(df, x='date', y='moisture', 
-                    title=f"SMAP Soil Moisture – {scenario_name}",
-                    labels={'moisture': 'Moisture (%)'})
-        
-        # Embed chart in HTML
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Harvest Horizon – {scenario_name}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; background: #f0f8f0; padding: 20px; }}
-                h1 {{ color: #2e7d32; }}
-                .container {{ max-width: 1200px; margin: auto; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🛰️ NASA Dashboard: {scenario_name}</h1>
-                <p>Real satellite data driving your farming decisions.</p>
-                {pio.to_html(fig, include_plotlyjs='cdn', full_html=False)}
-                
-                <h2>🌱 Scenario Info</h2>
-                <p><strong>Crop:</strong> {self.scenario['name']}</p>
-                <p><strong>Difficulty:</strong> {self.scenario['difficulty']}</p
-            </div>
-        </body>
-        </html>
-        """
+    def generate_html_dashboard(self, nasa_data, scenario_name) -> str:
+        """Return the NASA dashboard HTML, saving a copy named by its inputs"""
+        key = (scenario_name, self.scenario.name, self.scenario.difficulty,
+               tuple(nasa_data.get('moisture_series', [30]*30)))
+        html_content = render_dashboard_html(*key)
+        
+        # Same inputs give the same HTML, so an existing file is already current
+        path = f"dashboard_{hashlib.sha1(repr(key).encode()).hexdigest()[:12]}.html"
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html_content)
+        
+        return html_content
+
+@st.cache_data(show_spinner=False)
+def load_dashboard_file(path, mtime):
+    """Read a dashboard file once per modification time instead of every rerun."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+# Results chart - one figure per chart shape is kept and redrawn in place
+@st.cache_resource(show_spinner=False)
+def _get_fig(name, w, h):
+    """Shared across sessions, so redraws go through the returned lock."""
+    fig, ax = _get_plt().subplots(figsize=(w, h))
+    return fig, ax, threading.Lock()
+
+def show_yield_bar(yield_pct):
+    fig, ax, lock = _get_fig('yield', 8, 2)
+    color = '#4CAF50' if yield_pct > 100 else '#FF9800' if yield_pct > 85 else '#F44336'
+    
+    with lock:
+        ax.clear()
+        ax.barh([0], [yield_pct], color=color, height=0.5)
+        ax.barh([0], [150], color='lightgray', alpha=0.3, height=0.5)
+        ax.set_xlim(0, 150)
+        ax.set_ylim(-0.5, 0.5)
+        ax.axis('off')
+        ax.text(yield_pct/2, 0, f'{yield_pct}%', ha='center', va='center', 
+                fontsize=16, fontweight='bold', color='white')
+        st.pyplot(fig)
+
+# Decision area - runs as a fragment so interacting with it only reruns this part
+@st.fragment
+def decision_fragment(analysis, game):
+    # Sliders only take effect on submit, so dragging them doesn't rerun the page
+    with st.form("decisions"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("💧 Irrigation Level")
+            irrigation = st.slider(
+                "How much water to apply?",
+                min_value=0,
+                max_value=100,
+                value=50,
+                help="Consider soil moisture and rainfall patterns"
+            )
+            st.caption("💰 Water usage: ~10 liters per unit")
         
-        with open("dashboard.html", "w", encoding="utf-8") as f:
-            f.write(html_content)
+        with col2:
+            st.subheader("🌱 Fertilizer Amount")
+            fertilizer = st.slider(
+                "How much fertilizer?",
+                min_value=0,
+                max_value=100,
+                value=50,
+                help="Optimal range varies by crop. Above 70 risks runoff; below 30 may limit growth"
+            )
+            st.caption("💰 Cost: $5 per unit")
+        
+        st.write("")
+        
+        submitted = st.form_submit_button("🌾 Harvest & See Results", use_container_width=True, type="primary")
+    
+    if submitted:
+        results = game.calculate_yield(irrigation, fertilizer, analysis=analysis)
+        st.session_state.results = results
+        st.session_state.game_state = 'results'
+        st.rerun()
 
 # Scenarios
+class Scenario(NamedTuple):
+    name: str
+    difficulty: str
+    description: str
+    lat: float
+    lon: float
+    opt_irr: int
+    opt_fert: int
+
 SCENARIOS = {
-    'wheat_kansas': {
-        'name': '🌾 Wheat Farm - Kansas, USA',
-        'difficulty': 'Easy',
-        'description': 'Moderate climate with variable rainfall. Learn basic soil moisture monitoring.',
-        'location': {'lat': 37.5, 'lon': -95.5},
-        'optimal': {'irrigation': 45, 'fertilizer': 50}
-    },
-    'corn_iowa': {
-        'name': '🌽 Corn Farm - Iowa, USA',
-        'difficulty': 'Medium',
-        'description': 'Higher water needs. Balance abundant water with crop requirements.',
-        'location': {'lat': 42.0, 'lon': -93.5},
-        'optimal': {'irrigation': 60, 'fertilizer': 55}
-    },
-    'rice_california': {
-        'name': '🍚 Rice Farm - California, USA',
-        'difficulty': 'Hard',
-        'description': 'High water needs in drought-prone region. Conservation is critical!',
-        'location': {'lat': 39.0, 'lon': -121.5},
-        'optimal': {'irrigation': 80, 'fertilizer': 45}
-    }
+    'wheat_kansas': Scenario(
+        name='🌾 Wheat Farm - Kansas, USA',
+        difficulty='Easy',
+        description='Moderate climate with variable rainfall. Learn basic soil moisture monitoring.',
+        lat=37.5, lon=-95.5,
+        opt_irr=45, opt_fert=50
+    ),
+    'corn_iowa': Scenario(
+        name='🌽 Corn Farm - Iowa, USA',
+        difficulty='Medium',
+        description='Higher water needs. Balance abundant water with crop requirements.',
+        lat=42.0, lon=-93.5,
+        opt_irr=60, opt_fert=55
+    ),
+    'rice_california': Scenario(
+        name='🍚 Rice Farm - California, USA',
+        difficulty='Hard',
+        description='High water needs in drought-prone region. Conservation is critical!',
+        lat=39.0, lon=-121.5,
+        opt_irr=80, opt_fert=45
+    )
 }
 
 # Initialize session state
 if 'game_state' not in st.session_state:
     st.session_state.game_state = 'welcome'
-    st.session_state.nasa_fetcher = NASADataFetcher()
     st.session_state.current_scenario = 'wheat_kansas'
     st.session_state.game = None
     st.session_state.results = None
+    st.session_state.prefetched = prefetch_scenarios()
 
 # Header
 st.markdown('<p class="main-header">🌾 Harvest Horizon</p>', unsafe_allow_html=True)
@@ -360,14 +588,7 @@ if st.session_state.game_state == 'welcome':
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        st.markdown("""
-        <div class="success-box">
-        <h3 style="color: green;">🎯 Your Mission</h3>
-        <p style="color: green;">You're a farm manager using NASA satellite data to optimize your harvest. 
-        Make smart decisions about irrigation and fertilization based on real climate data!</p>
-        <p style="color: green;"><strong>Goal:</strong> Maximize yield while conserving resources.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_MISSION_HTML, unsafe_allow_html=True)
         
         st.write("")
         st.subheader("Choose Your Farm:")
@@ -375,11 +596,11 @@ if st.session_state.game_state == 'welcome':
         scenario_choice = st.radio(
             "Select difficulty level:",
             options=list(SCENARIOS.keys()),
-            format_func=lambda x: f"{SCENARIOS[x]['name']} - {SCENARIOS[x]['difficulty']}",
+            format_func=lambda x: f"{SCENARIOS[x].name} - {SCENARIOS[x].difficulty}",
             key='scenario_select'
         )
         
-        st.info(SCENARIOS[scenario_choice]['description'])
+        st.info(SCENARIOS[scenario_choice].description)
         
         st.write("")
         if st.button("🚀 Start Farming", use_container_width=True, type="primary"):
@@ -387,7 +608,10 @@ if st.session_state.game_state == 'welcome':
             st.session_state.game = FarmingSimulator(SCENARIOS[scenario_choice])
             
             with st.spinner("Loading NASA satellite data..."):
-                st.session_state.game.load_nasa_data(st.session_state.nasa_fetcher)
+                st.session_state.game.load_nasa_data(
+                    get_nasa_fetcher(),
+                    prefetched=st.session_state.prefetched.get(scenario_choice)
+                )
                 time.sleep(1)
             
             st.session_state.game_state = 'playing'
@@ -398,7 +622,10 @@ if st.session_state.game_state == 'welcome':
             st.session_state.game = FarmingSimulator(SCENARIOS[scenario_choice])
             
             with st.spinner("Loading NASA satellite data..."):
-                st.session_state.game.load_nasa_data(st.session_state.nasa_fetcher)
+                st.session_state.game.load_nasa_data(
+                    get_nasa_fetcher(),
+                    prefetched=st.session_state.prefetched.get(scenario_choice)
+                )
                 
                 # ✅ Generate HTML dashboard after loading data
                 # st.session_state.game.generate_html_dashboard(
@@ -414,8 +641,7 @@ if st.session_state.game_state == 'welcome':
 # Show HTML dashboard if game is playing and dashboard exists
 elif st.session_state.get('game_state') == 'multi-playing' and st.session_state.get('show_dashboard'):
     if os.path.exists("dashboard.html"):
-        with open("dashboard.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = load_dashboard_file("dashboard.html", os.path.getmtime("dashboard.html"))
         st.subheader("🛰️ Harvest Horizon: The Satellite Steward - Multiplayer")
         components.html(html_content, height=1600, scrolling=True)
     else:
@@ -467,23 +693,17 @@ elif st.session_state.game_state == 'playing':
         
         with col1:
             st.write("**Recent Temperature Trend**")
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.plot(range(1, 11), analysis['temp_data'], 'r-o', linewidth=2)
-            ax.set_xlabel('Days Ago')
-            ax.set_ylabel('Temperature (°C)')
-            ax.grid(True, alpha=0.3)
-            st.pyplot(fig)
-            plt.close()
+            st.line_chart(
+                pd.DataFrame({'Temp °C': analysis['temp_data']}, index=pd.Index(range(1, 11), name='Days Ago')),
+                color='#FF0000'
+            )
         
         with col2:
             st.write("**Recent Precipitation**")
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.bar(range(1, 11), analysis['precip_data'], color='skyblue')
-            ax.set_xlabel('Days Ago')
-            ax.set_ylabel('Rainfall (mm)')
-            ax.grid(True, alpha=0.3, axis='y')
-            st.pyplot(fig)
-            plt.close()
+            st.bar_chart(
+                pd.DataFrame({'Rain mm': analysis['precip_data']}, index=pd.Index(range(1, 11), name='Days Ago')),
+                color='#87CEEB'
+            )
     
     # Decision Making
     st.markdown("---")
@@ -497,47 +717,12 @@ elif st.session_state.game_state == 'playing':
     
     st.write("")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("💧 Irrigation Level")
-        irrigation = st.slider(
-            "How much water to apply?",
-            min_value=0,
-            max_value=100,
-            value=50,
-            help="Consider soil moisture and rainfall patterns"
-        )
-        st.caption(f"💰 Water usage: ~{irrigation * 10} liters")
-        
-        if analysis['avg_soil_moisture'] < 0.3:
-            st.warning("⚠️ Low soil moisture!")
-        elif analysis['avg_soil_moisture'] > 0.5:
-            st.info("💧 Soil already moist")
-    
-    with col2:
-        st.subheader("🌱 Fertilizer Amount")
-        fertilizer = st.slider(
-            "How much fertilizer?",
-            min_value=0,
-            max_value=100,
-            value=50,
-            help="Optimal range varies by crop"
-        )
-        st.caption(f"💰 Cost: ${fertilizer * 5}")
-        
-        if fertilizer > 70:
-            st.warning("⚠️ High fertilizer = runoff risk")
-        elif fertilizer < 30:
-            st.info("💡 Low fertilizer may limit growth")
-    
-    st.write("")
+    if analysis['avg_soil_moisture'] < 0.3:
+        st.warning("⚠️ Low soil moisture!")
+    elif analysis['avg_soil_moisture'] > 0.5:
+        st.info("💧 Soil already moist")
     
-    if st.button("🌾 Harvest & See Results", use_container_width=True, type="primary"):
-        results = game.calculate_yield(irrigation, fertilizer)
-        st.session_state.results = results
-        st.session_state.game_state = 'results'
-        st.rerun()
+    decision_fragment(analysis, game)
 
 elif st.session_state.game_state == 'results':
     results = st.session_state.results
@@ -584,33 +769,12 @@ elif st.session_state.game_state == 'results':
         st.write(f"**Fertilizer Cost:** ${results['fert_cost']}")
         
         # Visual yield bar
-        fig, ax = plt.subplots(figsize=(8, 2))
-        color = '#4CAF50' if yield_pct > 100 else '#FF9800' if yield_pct > 85 else '#F44336'
-        ax.barh([0], [yield_pct], color=color, height=0.5)
-        ax.barh([0], [150], color='lightgray', alpha=0.3, height=0.5)
-        ax.set_xlim(0, 150)
-        ax.set_ylim(-0.5, 0.5)
-        ax.axis('off')
-        ax.text(yield_pct/2, 0, f'{yield_pct}%', ha='center', va='center', 
-                fontsize=16, fontweight='bold', color='white')
-        st.pyplot(fig)
-        plt.close()
+        show_yield_bar(yield_pct)
     
     # Educational content
     st.markdown("---")
     st.subheader("📚 What You Learned")
-    st.markdown("""
-    <div class="success-box">
-    <p style="color: blue;"><strong>NASA satellite data helps farmers:</strong></p>
-    <ul>
-        <li style="color: blue;">✅ Monitor soil moisture for optimal irrigation</li>
-        <li style="color: blue;">✅ Track temperature and rainfall patterns</li>
-        <li style="color: blue;">✅ Make data-driven conservation decisions</li>
-        <li style="color: blue;">✅ Improve yields sustainably (15-25% increase possible!)</li>
-        <li style="color: blue;">✅ Save water (20-30% reduction with precision agriculture)</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_LEARNED_HTML, unsafe_allow_html=True)
     
     st.write("")
     
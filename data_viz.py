@@ -1,7 +1,54 @@
-import matplotlib.pyplot as plt
+import streamlit as st
+import io
+import threading
+from functools import lru_cache
+import matplotlib as mpl
+mpl.use('Agg')  # Pin the backend; nothing here is interactive
+import matplotlib.style
+from matplotlib.figure import Figure
+import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+
+mpl.style.use('fast')
+mpl.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'font.size': 10
+})
+
+# One Figure per chart, cleared and redrawn on every call rather than rebuilt
+_FIG_POOL = {}
+_FIG_LOCK = threading.RLock()
+
+def _pooled_subplots(name, *args, figsize=None, **kwargs):
+    """subplots() for chart `name`, reusing and clearing the pooled Figure"""
+    with _FIG_LOCK:
+        if name not in _FIG_POOL:
+            # A bare Figure is never registered with pyplot, so nothing pins it
+            fig = Figure(figsize=figsize)
+            _FIG_POOL[name] = fig, fig.subplots(*args, **kwargs)
+        fig, axes = _FIG_POOL[name]
+        for ax in np.atleast_1d(axes):
+            ax.clear()
+        return fig, axes
+
+def _values(series):
+    """Values of one POWER parameter dict as a float array"""
+    return np.fromiter(series.values(), dtype=np.float64, count=len(series))
+
+@lru_cache(maxsize=64)
+def _parse_dates(keys):
+    """Parse a tuple of YYYYMMDD keys once; every parameter shares the same keys"""
+    dates = pd.to_datetime(list(keys), format='%Y%m%d', cache=True).values
+    dates.flags.writeable = False  # Shared between callers
+    return dates
+
+def _extract_series(params, key):
+    """Dates and values of one POWER parameter, parsed in a single vectorized pass"""
+    series = params[key]
+    return _parse_dates(tuple(series)), _values(series)
 
 def plot_temperature_trend(nasa_data):
     """
@@ -12,13 +59,9 @@ def plot_temperature_trend(nasa_data):
         return None
     
     params = nasa_data['properties']['parameter']
-    temp_data = params['T2M']
-    
-    # Convert to DataFrame
-    dates = [datetime.strptime(d, '%Y%m%d') for d in temp_data.keys()]
-    temps = list(temp_data.values())
+    dates, temps = _extract_series(params, 'T2M')
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _pooled_subplots('temperature', figsize=(10, 4))
     ax.plot(dates, temps, color='#FF6B6B', linewidth=2, marker='o', markersize=4)
     ax.fill_between(dates, temps, alpha=0.3, color='#FF6B6B')
     
@@ -28,7 +71,7 @@ def plot_temperature_trend(nasa_data):
     ax.grid(True, alpha=0.3)
     ax.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def plot_precipitation_bars(nasa_data):
@@ -40,13 +83,9 @@ def plot_precipitation_bars(nasa_data):
         return None
     
     params = nasa_data['properties']['parameter']
-    precip_data = params['PRECTOTCORR']
-    
-    # Convert to DataFrame
-    dates = [datetime.strptime(d, '%Y%m%d') for d in precip_data.keys()]
-    precip = list(precip_data.values())
+    dates, precip = _extract_series(params, 'PRECTOTCORR')
     
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _pooled_subplots('precipitation', figsize=(10, 4))
     bars = ax.bar(dates, precip, color='#4ECDC4', alpha=0.7, edgecolor='#2C7873')
     
     # Highlight days with high rainfall
@@ -62,15 +101,19 @@ def plot_precipitation_bars(nasa_data):
     ax.grid(True, alpha=0.3, axis='y')
     ax.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
-def plot_soil_moisture_gauge(current_moisture):
+def plot_soil_moisture_gauge(current_moisture, use_plotly=True):
     """
     Create soil moisture gauge/meter
     Team Member 2: Make this visually appealing!
+    use_plotly=False returns the original matplotlib pie gauge
     """
-    fig, ax = plt.subplots(figsize=(6, 4), subplot_kw=dict(aspect="equal"))
+    if use_plotly:
+        return _soil_gauge_plotly(current_moisture)
+    
+    fig, ax = _pooled_subplots('soil', figsize=(6, 4), subplot_kw=dict(aspect="equal"))
     
     # Define moisture levels
     categories = ['Dry\n0-0.3', 'Optimal\n0.3-0.5', 'Wet\n0.5-1.0']
@@ -99,22 +142,26 @@ def plot_soil_moisture_gauge(current_moisture):
     ax.set_title(f'Current Soil Moisture: {current_moisture:.2f}', 
                  fontsize=12, fontweight='bold', pad=20)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
-def plot_comparison_chart(player_decisions, optimal_decisions):
+def plot_comparison_chart(player_decisions, optimal_decisions, use_plotly=True):
     """
     Compare player decisions vs optimal
     Team Member 2: Show how well player did!
+    use_plotly=False returns the original matplotlib bar chart
     """
     categories = ['Irrigation', 'Fertilizer']
     player_vals = [player_decisions['irrigation'], player_decisions['fertilizer']]
     optimal_vals = [optimal_decisions['irrigation'], optimal_decisions['fertilizer']]
     
+    if use_plotly:
+        return _comparison_plotly(categories, player_vals, optimal_vals)
+    
     x = np.arange(len(categories))
     width = 0.35
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = _pooled_subplots('comparison', figsize=(8, 5))
     bars1 = ax.bar(x - width/2, player_vals, width, label='Your Decision', 
                     color='#FF6B6B', alpha=0.8)
     bars2 = ax.bar(x + width/2, optimal_vals, width, label='Optimal', 
@@ -135,29 +182,32 @@ def plot_comparison_chart(player_decisions, optimal_decisions):
                    f'{int(height)}',
                    ha='center', va='bottom', fontsize=10)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
-def create_yield_progress_bar(yield_pct):
+def _yield_rating(yield_pct):
+    """Bar color and label for a yield percentage"""
+    if yield_pct > 110:
+        return '#8FD14F', 'Excellent!'
+    elif yield_pct > 90:
+        return '#4ECDC4', 'Good'
+    elif yield_pct > 70:
+        return '#FFB347', 'Fair'
+    return '#FF6B6B', 'Needs Improvement'
+
+def create_yield_progress_bar(yield_pct, use_plotly=True):
     """
     Create visual progress bar for yield
     Team Member 2: Make this eye-catching!
+    use_plotly=False returns the original matplotlib bar
     """
-    fig, ax = plt.subplots(figsize=(10, 2))
-    
     # Determine color based on performance
-    if yield_pct > 110:
-        color = '#8FD14F'
-        label = 'Excellent!'
-    elif yield_pct > 90:
-        color = '#4ECDC4'
-        label = 'Good'
-    elif yield_pct > 70:
-        color = '#FFB347'
-        label = 'Fair'
-    else:
-        color = '#FF6B6B'
-        label = 'Needs Improvement'
+    color, label = _yield_rating(yield_pct)
+    
+    if use_plotly:
+        return _yield_bar_plotly(yield_pct, color, label)
+    
+    fig, ax = _pooled_subplots('yield', figsize=(10, 2))
     
     # Create horizontal bar
     ax.barh([0], [yield_pct], height=0.5, color=color, alpha=0.8, edgecolor='black', linewidth=2)
@@ -172,7 +222,7 @@ def create_yield_progress_bar(yield_pct):
     ax.axis('off')
     ax.set_title('Crop Yield Performance', fontsize=14, fontweight='bold', pad=20)
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def plot_multi_parameter_timeline(nasa_data):
@@ -185,28 +235,28 @@ def plot_multi_parameter_timeline(nasa_data):
     
     params = nasa_data['properties']['parameter']
     
-    dates = [datetime.strptime(d, '%Y%m%d') for d in params['T2M'].keys()]
-    temps = list(params['T2M'].values())
-    precip = list(params['PRECTOTCORR'].values())
-    soil = list(params['GWETROOT'].values())
+    # Parse the shared date axis once; the other series only need their values
+    dates, temps = _extract_series(params, 'T2M')
+    precip = _values(params['PRECTOTCORR'])
+    soil = _values(params['GWETROOT'])
     
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 8), sharex=True)
+    fig, (ax1, ax2, ax3) = _pooled_subplots('timeline', 3, 1, figsize=(10, 8), sharex=True)
     
     # Temperature
-    ax1.plot(dates, temps, color='#FF6B6B', linewidth=2)
-    ax1.fill_between(dates, temps, alpha=0.3, color='#FF6B6B')
+    ax1.plot(dates, temps, color='#FF6B6B', linewidth=2, rasterized=True)
+    ax1.fill_between(dates, temps, alpha=0.3, color='#FF6B6B', rasterized=True)
     ax1.set_ylabel('Temp (°C)', fontsize=10)
     ax1.grid(True, alpha=0.3)
     ax1.set_title('Multi-Parameter Analysis', fontsize=14, fontweight='bold')
     
     # Precipitation
-    ax2.bar(dates, precip, color='#4ECDC4', alpha=0.7)
+    ax2.bar(dates, precip, color='#4ECDC4', alpha=0.7, rasterized=True)
     ax2.set_ylabel('Precip (mm)', fontsize=10)
     ax2.grid(True, alpha=0.3)
     
     # Soil Moisture
-    ax3.plot(dates, soil, color='#8FD14F', linewidth=2, marker='o', markersize=3)
-    ax3.fill_between(dates, soil, alpha=0.3, color='#8FD14F')
+    ax3.plot(dates, soil, color='#8FD14F', linewidth=2, marker='o', markersize=3, rasterized=True)
+    ax3.fill_between(dates, soil, alpha=0.3, color='#8FD14F', rasterized=True)
     ax3.axhspan(0.3, 0.5, alpha=0.2, color='green', label='Optimal range')
     ax3.set_ylabel('Soil Moisture', fontsize=10)
     ax3.set_xlabel('Date', fontsize=10)
@@ -214,41 +264,125 @@ def plot_multi_parameter_timeline(nasa_data):
     ax3.legend()
     ax3.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
+    fig.tight_layout()
+    return fig
+
+# Plotly versions - drawn in the browser instead of rasterized on the server
+def _soil_gauge_plotly(current_moisture):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=current_moisture,
+        number={'valueformat': '.2f'},
+        title={'text': 'Current Soil Moisture'},
+        gauge={
+            'axis': {'range': [0, 1]},
+            'bar': {'color': 'black', 'thickness': 0.2},
+            'steps': [
+                {'range': [0, 0.3], 'color': '#FFB6B9'},
+                {'range': [0.3, 0.5], 'color': '#8FD14F'},
+                {'range': [0.5, 1.0], 'color': '#4A90E2'}
+            ]
+        }
+    ))
+    fig.update_layout(height=350, margin=dict(t=60, b=20, l=30, r=30))
+    return fig
+
+def _comparison_plotly(categories, player_vals, optimal_vals):
+    fig = go.Figure([
+        go.Bar(x=categories, y=player_vals, name='Your Decision', marker_color='#FF6B6B',
+               opacity=0.8, text=player_vals, textposition='outside'),
+        go.Bar(x=categories, y=optimal_vals, name='Optimal', marker_color='#8FD14F',
+               opacity=0.8, text=optimal_vals, textposition='outside')
+    ])
+    fig.update_layout(title='Your Decisions vs Optimal', yaxis_title='Amount (units)', barmode='group')
     return fig
 
+def _yield_bar_plotly(yield_pct, color, label):
+    fig = go.Figure([
+        go.Bar(x=[150], y=[0], orientation='h', marker_color='lightgray', opacity=0.3,
+               hoverinfo='skip'),
+        go.Bar(x=[yield_pct], y=[0], orientation='h', marker_color=color, opacity=0.8,
+               marker_line=dict(color='black', width=2),
+               text=f'{yield_pct}% - {label}', textposition='inside', insidetextanchor='middle',
+               textfont=dict(size=16, color='white'))
+    ])
+    fig.update_layout(
+        title='Crop Yield Performance', barmode='overlay', showlegend=False, height=200,
+        xaxis=dict(range=[0, 150], visible=False), yaxis=dict(visible=False)
+    )
+    return fig
+
+def _data_key(nasa_data):
+    """Stable cache key for a NASA POWER payload"""
+    header = nasa_data.get('header')
+    if header:
+        coords = tuple(nasa_data.get('geometry', {}).get('coordinates', ()))
+        return (header.get('start'), header.get('end'), coords)
+    # Sample data has no header, so key on the temperature series itself
+    return tuple(nasa_data['properties']['parameter']['T2M'].items())
+
+def _fig_to_png(fig, dpi=72):
+    """Rasterize a Figure once so the pooled Figure can be redrawn afterwards"""
+    # 72 dpi with a tight bbox is plenty for these charts and about half the bytes
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+    return buf.getvalue()
+
+def _build_figures(nasa_data):
+    """Build every chart shown by display_nasa_charts in one pass"""
+    figs = {'temperature': None, 'precipitation': None, 'soil': None, 'timeline': None}
+    if not nasa_data:
+        return figs
+    
+    # Hold the pool lock until each pooled Figure has been rasterized
+    with _FIG_LOCK:
+        figs['temperature'] = _fig_to_png(plot_temperature_trend(nasa_data))
+        figs['precipitation'] = _fig_to_png(plot_precipitation_bars(nasa_data))
+        figs['timeline'] = _fig_to_png(plot_multi_parameter_timeline(nasa_data))
+    
+    params = nasa_data['properties']['parameter']
+    soil_values = _values(params['GWETROOT'])
+    current_moisture = soil_values[-1] if soil_values.size else 0.4
+    figs['soil'] = plot_soil_moisture_gauge(current_moisture)
+    return figs
+
+@st.cache_resource(show_spinner=False)
+def _cached_figures(key, _nasa_data):
+    """Charts for one dataset; the underscore keeps the payload out of the hash"""
+    return _build_figures(_nasa_data)
+
 # Helper function to integrate with Streamlit
-def display_nasa_charts(st, nasa_data):
+def display_nasa_charts(st, nasa_data, pre_rendered=True):
     """
     Easy function for UI team to call
     Usage in main app: display_nasa_charts(st, game.nasa_data)
+    With pre_rendered=True, charts are built once per dataset and reused
+    on every rerun and tab switch
     """
     st.subheader("📊 Detailed NASA Data Visualization")
     
+    if nasa_data and pre_rendered:
+        figs = _cached_figures(_data_key(nasa_data), nasa_data)
+    else:
+        figs = _build_figures(nasa_data)
+    
     tab1, tab2, tab3, tab4 = st.tabs(["🌡️ Temperature", "🌧️ Precipitation", "💧 Soil Moisture", "📈 All Data"])
     
     with tab1:
-        fig = plot_temperature_trend(nasa_data)
-        if fig:
-            st.pyplot(fig)
+        if figs['temperature']:
+            st.image(figs['temperature'])
     
     with tab2:
-        fig = plot_precipitation_bars(nasa_data)
-        if fig:
-            st.pyplot(fig)
+        if figs['precipitation']:
+            st.image(figs['precipitation'])
     
     with tab3:
-        if nasa_data:
-            params = nasa_data['properties']['parameter']
-            soil_values = list(params['GWETROOT'].values())
-            current_moisture = soil_values[-1] if soil_values else 0.4
-            fig = plot_soil_moisture_gauge(current_moisture)
-            st.pyplot(fig)
+        if figs['soil']:
+            st.plotly_chart(figs['soil'], use_container_width=True)
     
     with tab4:
-        fig = plot_multi_parameter_timeline(nasa_data)
-        if fig:
-            st.pyplot(fig)
+        if figs['timeline']:
+            st.image(figs['timeline'])
 
 # Export all functions
 __all__ = [
@@ -1,54 +1,140 @@
 import streamlit as st
+import asyncio
 import requests
+import httpx
+import diskcache
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
-import json
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit('UniTuple(f8, 3)(f8[:], f8[:], f8[:])', cache=True)
+def _analyze_core(temps, precip, soil):
+    """Mean temperature, precipitation and soil moisture"""
+    return temps.mean(), precip.mean(), soil.mean()
+
+
+@njit('f8(f8, f8, f8)', cache=True, fastmath=True)
+def _yield_core(soil_moisture, irrigation, fertilizer):
+    """Yield percentage from soil moisture and player decisions"""
+    base_yield = 100.0  # Base yield percentage
+
+    # Optimal soil moisture: 0.3-0.5
+    if soil_moisture < 0.3:
+        if irrigation >= 50:  # Player compensated with irrigation
+            base_yield += 10
+        else:
+            base_yield -= 30  # Crop suffered from drought
+    elif soil_moisture > 0.5:
+        if irrigation <= 30:  # Player wisely reduced irrigation
+            base_yield += 15
+        else:
+            base_yield -= 20  # Overwatering
+
+    # Factor in fertilizer
+    if 40 <= fertilizer <= 60:  # Optimal range
+        base_yield += 20
+    elif fertilizer > 80:
+        base_yield -= 10  # Over-fertilization
+    elif fertilizer < 20:
+        base_yield -= 15  # Under-fertilization
+
+    return base_yield
+
 
 # NASA POWER API Integration
 class NASADataFetcher:
     """Fetches real NASA climate data"""
     BASE_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
+    CACHE_DIR = '.nasa_cache'
+    CACHE_TTL = 86400 * 7  # Refresh cached responses weekly
     
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, ttl=CACHE_TTL):
+        self.ttl = ttl
+        self.cache = diskcache.Cache(self.CACHE_DIR, size_limit=100 * 1024 * 1024)
+        self.session = requests.Session()
     
-    def get_climate_data(self, lat, lon, start_date, end_date):
-        """Fetch temperature, precipitation, soil moisture data"""
+    def _request(self, lat, lon, start_date, end_date):
+        """Build the cache key and query parameters for one location"""
         # Parameters: T2M (temp), PRECTOTCORR (precip), GWETROOT (soil moisture)
+        start, end = start_date.strftime('%Y%m%d'), end_date.strftime('%Y%m%d')
         params = {
             'parameters': 'T2M,PRECTOTCORR,GWETROOT,ALLSKY_SFC_SW_DWN',
             'community': 'AG',
             'longitude': lon,
             'latitude': lat,
-            'start': start_date.strftime('%Y%m%d'),
-            'end': end_date.strftime('%Y%m%d'),
+            'start': start,
+            'end': end,
             'format': 'JSON'
         }
+        return f"{lat}_{lon}_{start}_{end}", params
+    
+    def get_climate_data(self, lat, lon, start_date, end_date):
+        """Fetch temperature, precipitation, soil moisture data"""
+        cache_key, params = self._request(lat, lon, start_date, end_date)
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return data
         
-        cache_key = f"{lat}_{lon}_{start_date}_{end_date}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        try:
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self.cache.set(cache_key, data, expire=self.ttl)
+            return data
+        except Exception as e:
+            st.error(f"API Error: {e}. Using sample data.")
+            return self._get_sample_data()
+    
+    async def _fetch_one(self, client, lat, lon, start_date, end_date):
+        """Fetch one location over a shared async client"""
+        cache_key, params = self._request(lat, lon, start_date, end_date)
+        data = self.cache.get(cache_key)
+        if data is not None:
+            return data
         
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = await client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
-            self.cache[cache_key] = data
+            data = orjson.loads(response.content)
+            self.cache.set(cache_key, data, expire=self.ttl)
             return data
         except Exception as e:
             st.error(f"API Error: {e}. Using sample data.")
             return self._get_sample_data()
     
+    async def _fetch_batch(self, locations, start_date, end_date):
+        limits = httpx.Limits(max_connections=20)
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=10) as client:
+            return await asyncio.gather(*[
+                self._fetch_one(client, lat, lon, start_date, end_date)
+                for lat, lon in locations
+            ])
+    
+    def get_climate_data_batch(self, locations, start_date, end_date):
+        """Fetch several (lat, lon) locations concurrently, in input order"""
+        return asyncio.run(self._fetch_batch(locations, start_date, end_date))
+    
     def _get_sample_data(self):
         """Fallback sample data if API fails"""
-        dates = pd.date_range(end=datetime.now(), periods=30)
+        keys = pd.date_range(end=datetime.now(), periods=30).strftime('%Y%m%d').tolist()
+        idx = np.arange(30)
         return {
             'properties': {
                 'parameter': {
-                    'T2M': {date.strftime('%Y%m%d'): 20 + i % 10 for i, date in enumerate(dates)},
-                    'PRECTOTCORR': {date.strftime('%Y%m%d'): 2.5 + (i % 5) for i, date in enumerate(dates)},
-                    'GWETROOT': {date.strftime('%Y%m%d'): 0.3 + (i % 3) * 0.1 for i, date in enumerate(dates)},
-                    'ALLSKY_SFC_SW_DWN': {date.strftime('%Y%m%d'): 5.5 for i, date in enumerate(dates)}
+                    'T2M': dict(zip(keys, (20 + idx % 10).tolist())),
+                    'PRECTOTCORR': dict(zip(keys, (2.5 + idx % 5).tolist())),
+                    'GWETROOT': dict(zip(keys, (0.3 + (idx % 3) * 0.1).tolist())),
+                    'ALLSKY_SFC_SW_DWN': dict.fromkeys(keys, 5.5)
                 }
             }
         }
@@ -61,6 +147,8 @@ class FarmingSimulator:
         self.crop_type = crop_type
         self.location = location
         self.nasa_data = None
+        self._arr = None
+        self._analysis = None
         self.decisions = {
             'irrigation': 0,
             'fertilizer': 0,
@@ -81,29 +169,42 @@ class FarmingSimulator:
             start_date,
             end_date
         )
+        self._cache_arrays()
+    
+    def _cache_arrays(self):
+        """Parse the series used by the analysis into arrays, once per load"""
+        params = self.nasa_data['properties']['parameter']
+        self._arr = {
+            key: np.fromiter(params[key].values(), dtype=np.float64)
+            for key in ('T2M', 'PRECTOTCORR', 'GWETROOT')
+        }
+        self._analysis = None
     
     def analyze_conditions(self):
         """Analyze NASA data for farming recommendations"""
         if not self.nasa_data:
             return {}
         
-        params = self.nasa_data['properties']['parameter']
+        # The data only changes in load_nasa_data, so repeat calls reuse this
+        if self._analysis is not None:
+            return self._analysis
+        if self._arr is None:
+            self._cache_arrays()
         
         # Calculate averages
-        temps = list(params['T2M'].values())
-        precip = list(params['PRECTOTCORR'].values())
-        soil_moisture = list(params['GWETROOT'].values())
-        
-        avg_temp = sum(temps) / len(temps)
-        avg_precip = sum(precip) / len(precip)
-        avg_soil = sum(soil_moisture) / len(soil_moisture)
+        avg_temp, avg_precip, avg_soil = (
+            float(v) for v in _analyze_core(
+                self._arr['T2M'], self._arr['PRECTOTCORR'], self._arr['GWETROOT']
+            )
+        )
         
-        return {
+        self._analysis = {
             'avg_temperature': round(avg_temp, 1),
             'avg_precipitation': round(avg_precip, 2),
             'avg_soil_moisture': round(avg_soil, 2),
             'recommendation': self._generate_recommendation(avg_temp, avg_precip, avg_soil)
         }
+        return self._analysis
     
     def _generate_recommendation(self, temp, precip, soil):
         """Generate farming recommendations based on data"""
@@ -130,32 +231,14 @@ class FarmingSimulator:
             return 0, "No data available"
         
         analysis = self.analyze_conditions()
-        base_yield = 100  # Base yield percentage
-        
-        # Factor in irrigation decisions
-        soil_moisture = analysis['avg_soil_moisture']
         irrigation = self.decisions['irrigation']
-        
-        # Optimal soil moisture: 0.3-0.5
-        if soil_moisture < 0.3:
-            if irrigation >= 50:  # Player compensated with irrigation
-                base_yield += 10
-            else:
-                base_yield -= 30  # Crop suffered from drought
-        elif soil_moisture > 0.5:
-            if irrigation <= 30:  # Player wisely reduced irrigation
-                base_yield += 15
-            else:
-                base_yield -= 20  # Overwatering
-        
-        # Factor in fertilizer
         fertilizer = self.decisions['fertilizer']
-        if 40 <= fertilizer <= 60:  # Optimal range
-            base_yield += 20
-        elif fertilizer > 80:
-            base_yield -= 10  # Over-fertilization
-        elif fertilizer < 20:
-            base_yield -= 15  # Under-fertilization
+        
+        base_yield = int(_yield_core(
+            float(analysis['avg_soil_moisture']),
+            float(irrigation),
+            float(fertilizer),
+        ))
         
         # Calculate costs
         self.water_usage = irrigation * 10  # liters per unit
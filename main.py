@@ -1,25 +1,26 @@
 # main.py
 import subprocess
 import sys
-import time
 import os
 
 def run_both():
     print("🚀 Starting Harvest Horizon...")
-    print("🎮 Launching Pygame client...")
-    pygame_proc = subprocess.Popen([sys.executable, "pygame_game.py"])
-    
-    time.sleep(2)
-    
+    # Streamlit takes longest to boot, so start it first and let both
+    # interpreters warm up side by side instead of sleeping between them
     print("📊 Launching Streamlit dashboard...")
     streamlit_proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", "streamlit_app.py", "--server.port=8501"])
     
+    print("🎮 Launching Pygame client...")
+    pygame_proc = subprocess.Popen([sys.executable, "pygame_game.py"])
+    
     try:
         pygame_proc.wait()
     except KeyboardInterrupt:
         pygame_proc.terminate()
-        streamlit_proc.terminate()
         print("\n🛑 Stopped both apps.")
+    finally:
+        streamlit_proc.terminate()
+        streamlit_proc.wait()
 
 if __name__ == "__main__":
-    run_both()
\ No newline at end of file
+    run_both()
@@ -1,6 +1,6 @@
 # main_game.py - Basic Structure
 import pygame
-import json
+import orjson
 import sys
 
 class HarvestHorizonGame:
@@ -8,6 +8,12 @@ class HarvestHorizonGame:
         pygame.init()
         self.screen = pygame.display.set_mode((1200, 800))
         self.clock = pygame.time.Clock()
+        self.dirty = []  # Screen rects changed this frame
+        self.needs_redraw = True
+        self.animating = False
+        self._fonts = {}
+        self._text_cache = {}  # (text, color, size) -> rendered Surface
+        self._ui_rect = None
         self.load_assets()
         self.load_game_data()
         self.current_player = 0
@@ -15,54 +21,101 @@ class HarvestHorizonGame:
         
     def load_assets(self):
         # Load images, fonts, sounds
-        self.board_image = pygame.image.load('assets/board.png')
+        # convert() to the display format once here (needs set_mode first),
+        # so blits don't re-convert pixels every frame
+        self.board_image = pygame.image.load('assets/board.png').convert()
         self.player_tokens = [
-            pygame.image.load('assets/player1.png'),
-            pygame.image.load('assets/player2.png')
+            pygame.image.load(f'assets/player{i}.png').convert_alpha()
+            for i in (1, 2)
         ]
         
+        # Static layer: background colour plus board, composed once
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill((45, 52, 54))  # Dark background
+        self.background.blit(self.board_image, (50, 50))
+        self.full_redraw = True
+        
     def load_game_data(self):
-        with open('game_content.json') as f:
-            self.game_data = json.load(f)
+        with open('game_content.json', 'rb') as f:
+            self.game_data = orjson.loads(f.read())
             
     def main_loop(self):
+        # Turn-based, so sleep until something happens instead of spinning
+        # at 60 FPS; the timeout keeps update() running while idle
         running = True
         while running:
-            for event in pygame.event.get():
+            events = [pygame.event.wait(100)] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.USEREVENT:
+                    self.needs_redraw = True  # Animation tick
                 self.handle_input(event)
                     
             self.update()
-            self.render()
-            self.clock.tick(60)
+            if self.needs_redraw:
+                self.render()
+                self.needs_redraw = False
             
+    def set_animating(self, animating):
+        # Only tick the animation timer while something is moving
+        if animating != self.animating:
+            pygame.time.set_timer(pygame.USEREVENT, 100 if animating else 0)
+            self.animating = animating
+        
     def handle_input(self, event):
-        # Handle mouse clicks, key presses
-        pass
+        # Handle mouse clicks, key presses; set self.needs_redraw on change
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self.needs_redraw = True
         
     def update(self):
         # Update game state
         pass
         
     def render(self):
-        # Draw everything
-        self.screen.fill((45, 52, 54))  # Dark background
-        self.draw_board()
+        # Draw everything, then push only the rects that changed
+        if self.full_redraw:
+            self.draw_board()
+            self.full_redraw = False
         self.draw_players()
         self.draw_ui()
-        pygame.display.flip()
+        if self.dirty:
+            pygame.display.update(self.dirty)
+            self.dirty.clear()
         
     def draw_board(self):
-        self.screen.blit(self.board_image, (50, 50))
+        self.dirty.append(self.screen.blit(self.background, (0, 0)))
+        
+    def erase(self, rect):
+        # Restore the static layer under something that moved
+        self.dirty.append(self.screen.blit(self.background, rect, rect))
         
     def draw_players(self):
-        # Draw player tokens on board
+        # Draw player tokens on board; append each blit's rect to self.dirty
         pass
         
+    def _font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+        
+    def _text(self, s, color=(255, 255, 255), size=24):
+        # font.render is slow, so each distinct label is rendered only once
+        key = (s, color, size)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._font(size).render(s, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+        
     def draw_ui(self):
-        # Draw cash, stats, buttons
-        pass
+        # Draw cash, stats, buttons; append each blit's rect to self.dirty
+        if self._ui_rect:
+            self.erase(self._ui_rect)
+        label = self._text(f"Player {self.current_player + 1} - {self.game_state}")
+        self._ui_rect = self.screen.blit(label, (50, 20))
+        self.dirty.append(self._ui_rect)
 
 if __name__ == "__main__":
     game = HarvestHorizonGame()
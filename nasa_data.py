@@ -1,6 +1,32 @@
 # nasa_data.py
 import random
 from datetime import datetime, timedelta
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit('i4[:](i8)', cache=True)
+def _gen_moisture(days):
+    out = np.empty(days, np.int32)
+    for i in range(days):
+        out[i] = min(90, max(10, 30 + np.random.randint(-15, 16)))
+    return out
+
+@njit('void(i8)', cache=True)
+def _seed_jit(seed):
+    np.random.seed(seed)
+
+def seed_simulation(seed):
+    """Seed every simulated generator (numba keeps its own RNG state)"""
+    random.seed(seed)
+    np.random.seed(seed)
+    _seed_jit(seed)
 
 def get_simulated_smap_data():
     """Simulate NASA SMAP soil moisture data (0-100%)"""
@@ -13,10 +39,9 @@ def get_simulated_ndvi():
     return round(random.uniform(0.3, 0.7), 2)
 
 def get_smap_timeseries(days=30):
-    import pandas as pd
-    dates = pd.date_range(end=datetime.today(), periods=days)
-    moisture = [max(10, min(90, 30 + random.randint(-15, 15))) for _ in range(days)]
-    return pd.DataFrame({"date": dates, "moisture": moisture})
+    """(dates, moisture) arrays for the last `days` days, ending today"""
+    dates = np.datetime64(datetime.today().date()) - np.arange(days - 1, -1, -1)
+    return dates, _gen_moisture(days)
 
 def get_nasa_explanation():
     return {
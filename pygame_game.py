@@ -2,9 +2,31 @@
 import pygame
 import json
 import random
+import hashlib
+from math import tau
+import numpy as np
+import string
 import time
 import sys
 import os
+from collections import OrderedDict
+from shared_state import StateWriter
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj, sort_keys=False):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+except ImportError:  # orjson is optional; stdlib json gives the same output
+    _loads = json.loads
+
+    def _dumps(obj, sort_keys=False):
+        return json.dumps(obj, sort_keys=sort_keys).encode()
+
+STATE_FILE = "game_state.json"  # Per-turn delta, rewritten on every save
+HEADER_FILE = "game_state_header.json"  # Fields that never change mid-game
+SCHEMA_VERSION = 1
 
 # Ensure assets dir exists (we'll draw shapes instead)
 os.makedirs("assets", exist_ok=True)
@@ -15,29 +37,91 @@ class HarvestHorizonGame:
         self.width, self.height = 1200, 800
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Harvest Horizon - The Satellite Steward")
+        # Have SDL drop every event type the game never reads at enqueue time
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 28)
+        # pygame's bundled default font; SysFont would scan the system font list
+        self._fonts = {}
+        self.font = self.get_font(36)
+        self.small_font = self.get_font(28)
+        self._text_cache = OrderedDict()  # (font id, text, color) -> Surface, LRU
+        self._atlases = {}  # (font id, color) -> (atlas Surface, {char: Rect})
         
         self.load_game_data()
         self.load_state()
+        self._last_save_time = 0.0
+        self._last_state_hash = None
+        self._save_pending = False
+        self._saved_header = None
+        try:
+            self._shm = StateWriter()  # Live handoff to the dashboard
+        except OSError:  # No shared memory here; the dashboard reads the JSON files
+            self._shm = None
+        self._published_hash = None
+        if self._shm:  # Publish the loaded state so readers never see a blank segment
+            delta = self._state_delta()
+            self._shm.publish(delta, self._card_ids, self._asset_ids)
+            self._published_hash = hash(_dumps(delta, sort_keys=True))
+        
+        # Labels that never change, rendered once; convert_alpha() (after
+        # set_mode) matches the display format so blits skip pixel conversion
+        self._static_surfaces = {
+            "tiles": [self.small_font.render(tile["name"][:10], True, (255, 255, 255)).convert_alpha()
+                      for tile in self.game_data["board_tiles"]],
+            "roll": self.font.render("Roll Dice", True, (255, 255, 255)).convert_alpha(),
+            "shop_title": self.font.render("Agri-Tech Store", True, (50, 205, 50)).convert_alpha()
+        }
+        self._build_board_surface()
+        self._tokens = [self._make_token((255, 0, 0)), self._make_token((0, 0, 255))]
         
         self.dice_value = 0
         self.is_rolling = False
         self.roll_start_time = 0
         self.rolling_dice = 1
+        self._dice_display = 0  # Face shown while rolling, flipped by update()
+        self._last_dice_flip = 0
         self.buttons = {}
         self.card_buttons = []
         self.shop_buttons = []
+        self._card_rects = []  # Parallel to card_buttons / shop_buttons, for collidelist
+        self._shop_rects = []
+        self._panel_key = None  # What the cached CARD/SHOP panel shows
+        self._panel = None  # (Surface, topleft) of that panel
+        self._dirty = True  # Redraw needed; render() is skipped while False
 
     def load_game_data(self):
-        with open("game_content.json", "r") as f:
-            self.game_data = json.load(f)
+        with open("game_content.json", "rb") as f:
+            self.game_data = _loads(f.read())
+        self._asset_by_id = {a["id"]: a for a in self.game_data["assets"]}
+        self._card_by_id = {c["id"]: c for c in self.game_data["problem_cards"]}
+        self._card_ids = [c["id"] for c in self.game_data["problem_cards"]]
+        self._asset_ids = [a["id"] for a in self.game_data["assets"]]
+        self._board_hash = hashlib.sha1(_dumps(self.game_data["board_tiles"], sort_keys=True)).hexdigest()
+        
+        # Board geometry never changes, so do the trig once as lookup tables
+        center = np.array([600, 400])
+        radius = 250
+        num_tiles = len(self.game_data["board_tiles"])
+        self._angle_lut = np.arange(num_tiles) * tau / num_tiles - tau / 4  # Start at top
+        self._cos_lut, self._sin_lut = np.cos(self._angle_lut), np.sin(self._angle_lut)
+        unit = np.column_stack((self._cos_lut, self._sin_lut))
+        self._tile_positions = (center + radius * unit).astype(int)  # (num_tiles, 2) pixels
+        self._player_ring_positions = (center + (radius - 20) * unit).astype(int)
 
     def load_state(self):
         try:
-            with open("game_state.json", "r") as f:
-                self.state = json.load(f)
+            with open(STATE_FILE, "rb") as f:
+                state = _loads(f.read())
+            if "players" in state:
+                self.state = state  # Legacy single-file format
+            else:
+                with open(HEADER_FILE, "rb") as f:
+                    header = _loads(f.read())
+                if header["board_hash"] != self._board_hash:
+                    raise ValueError("saved game is for a different board")
+                self.state = self._merge_state(header, state)
         except:
             self.state = {
                 "current_player": 0,
@@ -51,42 +135,163 @@ class HarvestHorizonGame:
                 "selected_solution": None
             }
 
-    def save_state(self):
-        self.state["last_update"] = time.strftime("%Y-%m-%dT%H:%M:%SZ")
-        with open("game_state.json", "w") as f:
-            json.dump(self.state, f, indent=2)
+    def get_font(self, size):
+        """Default font at `size`, loaded once and shared"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
 
-    def draw_board(self):
-        # Simple circular board with 10 tiles
-        center_x, center_y = 600, 400
-        radius = 250
-        num_tiles = len(self.game_data["board_tiles"])
+    TEXT_CACHE_SIZE = 256
+
+    def _render_text(self, text, font, color):
+        """font.render() through a small LRU cache; most labels repeat every frame"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is not None:
+            self._text_cache.move_to_end(key)
+            return surf
+        surf = font.render(text, True, color).convert_alpha()
+        self._text_cache[key] = surf
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surf
+
+    ATLAS_CHARS = string.digits + string.ascii_letters + string.punctuation + " "
+
+    def _glyph_atlas(self, font, color):
+        """Every ATLAS_CHARS glyph rendered once, packed into a single Surface"""
+        key = (id(font), color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            glyphs = [font.render(ch, True, color) for ch in self.ATLAS_CHARS]
+            surface = pygame.Surface((sum(g.get_width() for g in glyphs), font.get_height()), pygame.SRCALPHA)
+            rects = {}
+            x = 0
+            for ch, glyph in zip(self.ATLAS_CHARS, glyphs):
+                rects[ch] = surface.blit(glyph, (x, 0))
+                x += glyph.get_width()
+            atlas = self._atlases[key] = (surface.convert_alpha(), rects)
+        return atlas
+
+    def blit_string(self, text, pos, font, color):
+        """Blit `text` glyph by glyph from the atlas; for labels that change every turn"""
+        surface, rects = self._glyph_atlas(font, color)
+        if not all(ch in rects for ch in text):
+            self.screen.blit(self._render_text(text, font, color), pos)
+            return
+        x, y = pos
+        for ch in text:
+            rect = rects[ch]
+            self.screen.blit(surface, (x, y), rect)
+            x += rect.width
+
+    def _state_header(self):
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "names": [p["name"] for p in self.state["players"]],
+            "board_hash": self._board_hash
+        }
+
+    def _state_delta(self):
+        """The per-turn part of the state, one list entry per player"""
+        players = self.state["players"]
+        card = self.state.get("current_card")
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "current_player": self.state["current_player"],
+            "positions": [p["position"] for p in players],
+            "cash": [p["cash"] for p in players],
+            "sustainability": [p["sustainability"] for p in players],
+            "assets": [p["assets"] for p in players],
+            "game_state": self.state["game_state"],
+            "dice_value": self.state.get("dice_value", 0),
+            "current_card_id": card["id"] if card else None,
+            "selected_solution": self.state.get("selected_solution")
+        }
+
+    def _merge_state(self, header, delta):
+        """Rebuild the full in-memory state from the header and a delta"""
+        players = [
+            {"name": name, "position": pos, "cash": cash, "sustainability": sus, "assets": list(assets)}
+            for name, pos, cash, sus, assets in zip(header["names"], delta["positions"], delta["cash"],
+                                                    delta["sustainability"], delta["assets"])
+        ]
+        return {
+            "current_player": delta["current_player"],
+            "players": players,
+            "game_state": delta["game_state"],
+            "dice_value": delta["dice_value"],
+            "current_card": self._card_by_id.get(delta["current_card_id"]),
+            "selected_solution": delta["selected_solution"],
+            "last_update": delta.get("last_update")
+        }
+
+    def _write_atomic(self, path, data):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # Readers never see a partial file
+
+    SAVE_INTERVAL = 1.0  # Seconds between writes of game_state.json
+
+    def save_state(self, force=False):
+        """Write the state delta if it changed, at most once per SAVE_INTERVAL"""
+        delta = self._state_delta()
+        state_hash = hash(_dumps(delta, sort_keys=True))
+        # Shared memory is cheap to update, so it gets every change undebounced
+        if self._shm and state_hash != self._published_hash:
+            self._shm.publish(delta, self._card_ids, self._asset_ids)
+            self._published_hash = state_hash
+        if state_hash == self._last_state_hash:
+            self._save_pending = False
+            return
+        if not force and time.time() - self._last_save_time < self.SAVE_INTERVAL:
+            self._save_pending = True  # Flushed from update()
+            return
         
-        for i, tile in enumerate(self.game_data["board_tiles"]):
-            angle = (i / num_tiles) * 2 * 3.14159 - 1.57  # Start at top
-            x = center_x + radius * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            y = center_y + radius * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            
+        # The header only changes with the players or board; write it once
+        header = self._state_header()
+        if header != self._saved_header:
+            self._write_atomic(HEADER_FILE, _dumps(header))
+            self._saved_header = header
+        
+        delta["last_update"] = self.state["last_update"] = time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._write_atomic(STATE_FILE, _dumps(delta))
+        self._last_state_hash = state_hash
+        self._last_save_time = time.time()
+        self._save_pending = False
+
+    def _build_board_surface(self):
+        """Background plus board, drawn once; render() blits it each frame"""
+        self._board_surface = pygame.Surface((self.width, self.height)).convert()
+        self._board_surface.fill((20, 30, 40))  # Dark blue background
+        self.draw_board(self._board_surface)
+
+    def _make_token(self, color):
+        """Player token drawn once onto a 32x32 alpha surface"""
+        token = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.circle(token, color, (16, 16), 15)
+        pygame.draw.circle(token, (255, 255, 255), (16, 16), 15, 2)
+        return token.convert_alpha()
+
+    def draw_board(self, surface):
+        # Simple circular board with 10 tiles
+        for i, (tile, (x, y)) in enumerate(zip(self.game_data["board_tiles"], self._tile_positions.tolist())):
             color = (70, 130, 180) if tile["type"] == "field" else (50, 205, 50) if tile["type"] == "shop" else (255, 140, 0) if tile["type"] == "event" else (100, 100, 100)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), 40)
+            pygame.draw.circle(surface, color, (int(x), int(y)), 40)
             
-            text = self.small_font.render(tile["name"][:10], True, (255, 255, 255))
-            self.screen.blit(text, (x - text.get_width()//2, y - text.get_height()//2))
+            text = self._static_surfaces["tiles"][i]
+            surface.blit(text, (x - text.get_width()//2, y - text.get_height()//2))
 
     def draw_players(self):
-        center_x, center_y = 600, 400
-        radius = 250
-        num_tiles = len(self.game_data["board_tiles"])
-        
-        for idx, player in enumerate(self.state["players"]):
-            pos = player["position"]
-            angle = (pos / num_tiles) * 2 * 3.14159 - 1.57
-            x = center_x + (radius - 20) * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            y = center_y + (radius - 20) * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            
-            color = (255, 0, 0) if idx == 0 else (0, 0, 255)
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), 15)
-            pygame.draw.circle(self.screen, (255, 255, 255), (int(x), int(y)), 15, 2)
+        players = self.state["players"]
+        positions = np.fromiter((p["position"] for p in players), dtype=np.intp, count=len(players))
+        # One gather for every player's token corner instead of per-player math
+        corners = self._player_ring_positions[positions] - 16
+        for idx, (x, y) in enumerate(corners.tolist()):
+            token = self._tokens[0] if idx == 0 else self._tokens[1]
+            self.screen.blit(token, (x, y))
 
     def draw_ui(self):
         # Player info
@@ -97,95 +302,145 @@ class HarvestHorizonGame:
             f"Sustainability: {current['sustainability']}/10"
         ]
         for i, line in enumerate(info):
-            text = self.font.render(line, True, (255, 255, 255))
+            if i == 1:  # Cash changes every turn; build it from the glyph atlas
+                self.blit_string(line, (50, 50 + i*40), self.font, (255, 255, 255))
+                continue
+            text = self._render_text(line, self.font, (255, 255, 255))
             self.screen.blit(text, (50, 50 + i*40))
 
         # Game state
-        state_text = self.font.render(f"State: {self.state['game_state']}", True, (200, 200, 200))
+        state_text = self._render_text(f"State: {self.state['game_state']}", self.font, (200, 200, 200))
         self.screen.blit(state_text, (50, 200))
 
         # Dice
         if self.is_rolling:
-            dice_val = random.randint(1, 6)
+            dice_val = self._dice_display
         else:
             dice_val = self.state.get("dice_value", 0)
         
-        dice_text = self.font.render(f"Dice: {dice_val}", True, (255, 255, 0))
-        self.screen.blit(dice_text, (50, 250))
+        self.blit_string(f"Dice: {dice_val}", (50, 250), self.font, (255, 255, 0))
 
         # Buttons
         self.buttons = {}
         if self.state["game_state"] == "ROLL":
             btn = pygame.Rect(50, 320, 150, 50)
             pygame.draw.rect(self.screen, (0, 200, 0), btn)
-            text = self.font.render("Roll Dice", True, (255, 255, 255))
+            text = self._static_surfaces["roll"]
             self.screen.blit(text, (btn.x + 10, btn.y + 10))
             self.buttons["roll"] = btn
 
         elif self.state["game_state"] == "CARD" and self.state["current_card"]:
             card = self.state["current_card"]
-            pygame.draw.rect(self.screen, (30, 30, 50), (400, 100, 400, 300))
-            title = self.font.render(card["title"], True, (255, 215, 0))
-            self.screen.blit(title, (500, 120))
-            desc = self.small_font.render(card["description"], True, (255, 255, 255))
-            self.screen.blit(desc, (420, 170))
-            
-            self.card_buttons = []
-            for i, sol in enumerate(card["solutions"]):
-                btn = pygame.Rect(450, 220 + i*60, 300, 50)
-                pygame.draw.rect(self.screen, (70, 130, 180), btn)
-                sol_text = self.small_font.render(f"{sol['title']} (${sol['cost']})", True, (255, 255, 255))
-                self.screen.blit(sol_text, (btn.x + 10, btn.y + 15))
-                self.card_buttons.append((btn, sol))
+            self.screen.blit(*self._cached_panel(("CARD", card["id"]), self._build_card_panel))
 
         elif self.state["game_state"] == "SHOP":
-            pygame.draw.rect(self.screen, (30, 50, 30), (400, 100, 400, 300))
-            shop_title = self.font.render("Agri-Tech Store", True, (50, 205, 50))
-            self.screen.blit(shop_title, (500, 120))
-            
-            self.shop_buttons = []
-            for i, asset in enumerate(self.game_data["assets"]):
-                btn = pygame.Rect(450, 180 + i*70, 300, 60)
-                color = (100, 200, 100) if current["cash"] >= asset["cost"] else (100, 100, 100)
-                pygame.draw.rect(self.screen, color, btn)
-                asset_text = self.small_font.render(f"{asset['name']} (${asset['cost']})", True, (0, 0, 0) if color == (100,200,100) else (150,150,150))
-                desc_text = self.small_font.render(asset["description"], True, (200, 200, 200))
-                self.screen.blit(asset_text, (btn.x + 10, btn.y + 10))
-                self.screen.blit(desc_text, (btn.x + 10, btn.y + 30))
-                self.shop_buttons.append((btn, asset))
+            # Button colours only depend on which assets are affordable
+            key = ("SHOP", tuple(current["cash"] >= a["cost"] for a in self.game_data["assets"]))
+            self.screen.blit(*self._cached_panel(key, self._build_shop_panel))
+
+    def _cached_panel(self, key, build):
+        """Panel Surface for `key`, rebuilt only when the panel contents change"""
+        if key != self._panel_key:
+            self._panel = build()
+            self._panel_key = key
+        return self._panel
+
+    def _compose_panel(self, fills, blits):
+        """Draw rect fills and text blits (screen coords) onto one tight alpha Surface"""
+        rects = [rect for rect, _ in fills[1:]] + [surf.get_rect(topleft=pos) for surf, pos in blits]
+        bounds = fills[0][0].unionall(rects)
+        panel = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for rect, color in fills:
+            pygame.draw.rect(panel, color, rect.move(-bounds.x, -bounds.y))
+        for surf, (x, y) in blits:
+            panel.blit(surf, (x - bounds.x, y - bounds.y))
+        return panel.convert_alpha(), bounds.topleft
+
+    def _build_card_panel(self):
+        card = self.state["current_card"]
+        fills = [(pygame.Rect(400, 100, 400, 300), (30, 30, 50))]
+        blits = [
+            (self._render_text(card["title"], self.font, (255, 215, 0)), (500, 120)),
+            (self._render_text(card["description"], self.small_font, (255, 255, 255)), (420, 170))
+        ]
+        
+        self.card_buttons = []
+        for i, sol in enumerate(card["solutions"]):
+            btn = pygame.Rect(450, 220 + i*60, 300, 50)
+            fills.append((btn, (70, 130, 180)))
+            sol_text = self._render_text(f"{sol['title']} (${sol['cost']})", self.small_font, (255, 255, 255))
+            blits.append((sol_text, (btn.x + 10, btn.y + 15)))
+            self.card_buttons.append((btn, sol))
+        self._card_rects = [btn for btn, _ in self.card_buttons]
+        return self._compose_panel(fills, blits)
+
+    def _build_shop_panel(self):
+        current = self.state["players"][self.state["current_player"]]
+        fills = [(pygame.Rect(400, 100, 400, 300), (30, 50, 30))]
+        blits = [(self._static_surfaces["shop_title"], (500, 120))]
+        
+        self.shop_buttons = []
+        for i, asset in enumerate(self.game_data["assets"]):
+            btn = pygame.Rect(450, 180 + i*70, 300, 60)
+            color = (100, 200, 100) if current["cash"] >= asset["cost"] else (100, 100, 100)
+            fills.append((btn, color))
+            asset_text = self._render_text(f"{asset['name']} (${asset['cost']})", self.small_font, (0, 0, 0) if color == (100,200,100) else (150,150,150))
+            desc_text = self._render_text(asset["description"], self.small_font, (200, 200, 200))
+            blits.append((asset_text, (btn.x + 10, btn.y + 10)))
+            blits.append((desc_text, (btn.x + 10, btn.y + 30)))
+            self.shop_buttons.append((btn, asset))
+        self._shop_rects = [btn for btn, _ in self.shop_buttons]
+        return self._compose_panel(fills, blits)
 
     def handle_events(self):
+        # Drain the queue once; only the last click of the frame is dispatched
+        mouse_pos = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self.save_state(force=True)
+                if self._shm:
+                    self._shm.close()
                 pygame.quit()
                 sys.exit()
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                
-                if self.state["game_state"] == "ROLL" and "roll" in self.buttons:
-                    if self.buttons["roll"].collidepoint(mouse_pos):
-                        self.roll_dice()
-                
-                elif self.state["game_state"] == "CARD":
-                    for btn, sol in self.card_buttons:
-                        if btn.collidepoint(mouse_pos):
-                            self.select_solution(sol)
-                
-                elif self.state["game_state"] == "SHOP":
-                    current = self.state["players"][self.state["current_player"]]
-                    for btn, asset in self.shop_buttons:
-                        if btn.collidepoint(mouse_pos) and current["cash"] >= asset["cost"]:
-                            self.buy_asset(asset)
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._dirty = True
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = event.pos
+        
+        if mouse_pos is None:
+            return
+        self._dirty = True
+        
+        if self.state["game_state"] == "ROLL" and "roll" in self.buttons:
+            if self.buttons["roll"].collidepoint(mouse_pos):
+                self.roll_dice()
+        
+        elif self.state["game_state"] == "CARD":
+            # Buttons never overlap, so the first hit is the only hit
+            idx = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._card_rects)
+            if idx >= 0:
+                self.select_solution(self.card_buttons[idx][1])
+        
+        elif self.state["game_state"] == "SHOP":
+            current = self.state["players"][self.state["current_player"]]
+            idx = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._shop_rects)
+            if idx >= 0:
+                asset = self.shop_buttons[idx][1]
+                if current["cash"] >= asset["cost"]:
+                    self.buy_asset(asset)
 
     def roll_dice(self):
         self.is_rolling = True
         self.roll_start_time = pygame.time.get_ticks()
         self.rolling_dice = 1
+        self._dice_display = random.randint(1, 6)
+        self._last_dice_flip = self.roll_start_time
+        self._dirty = True
 
     def select_solution(self, solution):
         player = self.state["players"][self.state["current_player"]]
         if player["cash"] >= solution["cost"]:
+            self._dirty = True
             player["cash"] -= solution["cost"]
             if "sustainability_change" in solution["effect"]:
                 player["sustainability"] = max(1, min(10, player["sustainability"] + solution["effect"]["sustainability_change"]))
@@ -195,6 +450,7 @@ class HarvestHorizonGame:
 
     def buy_asset(self, asset):
         player = self.state["players"][self.state["current_player"]]
+        self._dirty = True
         player["cash"] -= asset["cost"]
         player["assets"].append(asset["id"])
         # Apply income boost immediately for simplicity
@@ -203,16 +459,25 @@ class HarvestHorizonGame:
         self.end_turn()
 
     def end_turn(self):
+        self._dirty = True
         self.state["current_player"] = (self.state["current_player"] + 1) % len(self.state["players"])
         self.save_state()
 
     def update(self):
+        if self._save_pending and time.time() - self._last_save_time >= self.SAVE_INTERVAL:
+            self.save_state()
+        
         if self.is_rolling:
             now = pygame.time.get_ticks()
+            if now - self._last_dice_flip > 100:  # Flip the shown face every 100 ms
+                self._dice_display = random.randint(1, 6)
+                self._last_dice_flip = now
+                self._dirty = True
             if now - self.roll_start_time > 1000:  # 1 second roll animation
                 self.dice_value = random.randint(1, 6)
                 self.state["dice_value"] = self.dice_value
                 self.is_rolling = False
+                self._dirty = True
                 
                 # Move player
                 player = self.state["players"][self.state["current_player"]]
@@ -229,18 +494,15 @@ class HarvestHorizonGame:
                     # Field: earn income
                     income = 500
                     # Bonus for assets
-                    for aid in player["assets"]:
-                        for asset in self.game_data["assets"]:
-                            if asset["id"] == aid:
-                                income += asset.get("income_boost", 0)
+                    income += sum(self._asset_by_id.get(aid, {}).get("income_boost", 0)
+                                  for aid in player["assets"])
                     player["cash"] += income
                     self.end_turn()
                 
                 self.save_state()
 
     def render(self):
-        self.screen.fill((20, 30, 40))  # Dark blue background
-        self.draw_board()
+        self.screen.blit(self._board_surface, (0, 0))
         self.draw_players()
         self.draw_ui()
         pygame.display.flip()
@@ -250,7 +512,9 @@ class HarvestHorizonGame:
         while running:
             self.handle_events()
             self.update()
-            self.render()
+            if self._dirty:
+                self.render()
+                self._dirty = False
             self.clock.tick(60)
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+# shared_state.py - pygame -> streamlit game state handoff over shared memory
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+SHM_NAME = "harvest_horizon_state"
+MAX_PLAYERS = 4
+MAX_ASSETS = 8
+GAME_STATES = ("ROLL", "CARD", "SHOP")
+
+# seq, players, current player, game state, dice, card index (-1 = none)
+_HEAD = struct.Struct("<IBBBBh")
+# position, cash, sustainability, owned count of each asset (catalogue order)
+_PLAYER = struct.Struct(f"<iqb{MAX_ASSETS}B")
+SIZE = _HEAD.size + MAX_PLAYERS * _PLAYER.size
+
+
+class StateWriter:
+    """Producer side: owns the segment and publishes each state change.
+
+    The sequence number works as a seqlock: it is odd while a write is in
+    progress, so readers retry instead of seeing a torn state.
+    """
+
+    def __init__(self):
+        try:
+            self.shm = shared_memory.SharedMemory(SHM_NAME, create=True, size=SIZE)
+        except FileExistsError:  # Left over from a client that crashed
+            self.shm = shared_memory.SharedMemory(SHM_NAME)
+        self._seq = 0
+
+    def publish(self, delta, card_ids, asset_ids):
+        """Pack a pygame_game state delta; ids map cards/assets to indices"""
+        buf = self.shm.buf
+        self._seq += 1  # Odd: write in progress
+        struct.pack_into("<I", buf, 0, self._seq)
+        card = delta["current_card_id"]
+        _HEAD.pack_into(buf, 0, self._seq, len(delta["positions"]), delta["current_player"],
+                        GAME_STATES.index(delta["game_state"]), delta["dice_value"],
+                        card_ids.index(card) if card in card_ids else -1)
+        players = zip(delta["positions"], delta["cash"], delta["sustainability"], delta["assets"])
+        for i, (pos, cash, sus, assets) in enumerate(players):
+            counts = [assets.count(a) for a in asset_ids[:MAX_ASSETS]]
+            counts += [0] * (MAX_ASSETS - len(counts))
+            _PLAYER.pack_into(buf, _HEAD.size + i * _PLAYER.size, pos, cash, sus, *counts)
+        self._seq += 1  # Even: consistent again
+        struct.pack_into("<I", buf, 0, self._seq)
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach():
+    """Open the segment without letting this process's tracker unlink it on exit"""
+    try:
+        return shared_memory.SharedMemory(SHM_NAME, track=False)
+    except TypeError:  # Python < 3.13 has no track=
+        shm = shared_memory.SharedMemory(SHM_NAME)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def read_state(card_ids, asset_ids, retries=100):
+    """Latest published delta; raises FileNotFoundError if no client is running
+    and KeyError if it has not published anything yet"""
+    shm = _attach()
+    try:
+        buf = shm.buf
+        for _ in range(retries):
+            seq, count, current, game_state, dice, card = _HEAD.unpack_from(buf, 0)
+            if seq % 2:
+                continue  # Writer is mid-update
+            players = [_PLAYER.unpack_from(buf, _HEAD.size + i * _PLAYER.size) for i in range(count)]
+            if struct.unpack_from("<I", buf, 0)[0] != seq:
+                continue  # Changed while we were reading
+            break
+        else:
+            raise TimeoutError("shared game state kept changing")
+    finally:
+        shm.close()
+    if not seq or not count:
+        raise KeyError("shared game state not published yet")
+
+    return {
+        "seq": seq,
+        "current_player": current,
+        "positions": [p[0] for p in players],
+        "cash": [p[1] for p in players],
+        "sustainability": [p[2] for p in players],
+        "assets": [[a for a, n in zip(asset_ids, p[3:]) for _ in range(n)] for p in players],
+        "game_state": GAME_STATES[game_state],
+        "dice_value": dice,
+        "current_card_id": card_ids[card] if card >= 0 else None,
+        "selected_solution": None
+    }
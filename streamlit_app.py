@@ -1 +1,125 @@
+# streamlit_app.py - live dashboard for the pygame client (see main.py)
+import streamlit as st
+import json
+import os
+import plotly.graph_objects as go
+from nasa_data import get_smap_timeseries
+from shared_state import read_state
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional
+    _loads = json.loads
+
+STATE_FILE = "game_state.json"  # Per-turn delta written by pygame_game
+HEADER_FILE = "game_state_header.json"  # Player names, written once per game
+CONTENT_FILE = "game_content.json"
+
+DEFAULT_STATE = {
+    "current_player": 0,
+    "players": [
+        {"name": "Player 1", "position": 0, "cash": 10000, "sustainability": 7, "assets": []},
+        {"name": "Player 2", "position": 0, "cash": 10000, "sustainability": 7, "assets": []}
+    ],
+    "game_state": "ROLL",
+    "dice_value": 0,
+    "current_card": None,
+    "selected_solution": None
+}
+
+st.set_page_config(page_title="Harvest Horizon Dashboard", page_icon="🌾", layout="wide")
+
+def _read(path):
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return None
+
+@st.cache_resource(show_spinner=False)
+def _content():
+    """Card lookup plus the card/asset id order shared_state packs indices with"""
+    content = _read(CONTENT_FILE)
+    cards = {c["id"]: c for c in content["problem_cards"]}
+    return cards, list(cards), [a["id"] for a in content["assets"]]
+
+def _merge(header, delta):
+    """Full state from the one-time header and a per-turn delta"""
+    players = [
+        {"name": name, "position": pos, "cash": cash, "sustainability": sus, "assets": assets}
+        for name, pos, cash, sus, assets in zip(header["names"], delta["positions"], delta["cash"],
+                                                delta["sustainability"], delta["assets"])
+    ]
+    return {
+        "current_player": delta["current_player"],
+        "players": players,
+        "game_state": delta["game_state"],
+        "dice_value": delta["dice_value"],
+        "current_card": _content()[0].get(delta["current_card_id"]),
+        "selected_solution": delta["selected_solution"],
+        "last_update": delta.get("last_update")
+    }
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _header(mtime):
+    return _read(HEADER_FILE)
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load(state_mtime, header_mtime):
+    """Merge header and delta files; the mtimes are only the cache key"""
+    delta = _read(STATE_FILE)
+    if "players" in delta:
+        return delta  # Legacy single-file format
+    return _merge(_header(header_mtime), delta)
+
+def load_game_state():
+    """Current game state: live from shared memory while the client runs, else from disk"""
+    try:
+        _, card_ids, asset_ids = _content()
+        return _merge(_header(_mtime(HEADER_FILE)), read_state(card_ids, asset_ids))
+    except (OSError, KeyError, json.JSONDecodeError):
+        pass  # Client not running, or no shared memory on this platform
+    try:
+        return _load(_mtime(STATE_FILE), _mtime(HEADER_FILE))
+    except (FileNotFoundError, KeyError, json.JSONDecodeError):
+        return DEFAULT_STATE
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def smap_figure(mtime):
+    """Soil moisture chart, rebuilt only when the game state file changes"""
+    dates, moisture = get_smap_timeseries()
+    fig = go.Figure(go.Scattergl(x=dates, y=moisture, mode="lines",
+                                 line=dict(color="#4CAF50")))
+    fig.update_layout(title="SMAP Soil Moisture (simulated, last 30 days)",
+                      yaxis_title="Moisture (%)", height=300, margin=dict(t=50, b=30))
+    return fig
+
+@st.fragment(run_every="2s")
+def game_panel():
+    state = load_game_state()
+    current = state["players"][state["current_player"]]
+
+    st.subheader(f"🎲 {current['name']}'s turn - {state['game_state']}")
+    st.caption(f"Last dice roll: {state.get('dice_value', 0)}"
+               + (f" · updated {state['last_update']}" if state.get("last_update") else ""))
+
+    cols = st.columns(len(state["players"]))
+    for col, player in zip(cols, state["players"]):
+        with col:
+            st.markdown(f"### {player['name']}")
+            st.metric("Cash", f"${player['cash']:,}")
+            st.metric("Sustainability", f"{player['sustainability']}/10")
+            st.write(f"Tile: {player['position']}")
+            st.write("Assets: " + (", ".join(player["assets"]) or "none"))
+
+    card = state.get("current_card")
+    if card:
+        st.info(f"**{card['title']}** - {card['description']}")
+
+    st.plotly_chart(smap_figure(_mtime(STATE_FILE)), use_container_width=True, key="smap")
+
+st.title("🌾 Harvest Horizon: The Satellite Steward")
+game_panel()